@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import os
 import re
@@ -17,122 +18,148 @@ def create_gui_and_run_script():
         base_name, _ = os.path.splitext(file_path)
         return base_name
 
-    def remove_column(df: pd.DataFrame, columns_to_remove: list) -> None:
-        """Removes specified columns from a Pandas DataFrame."""
-        df.drop(columns=columns_to_remove, errors='ignore', inplace=True)
+    def kept_columns(df: pd.DataFrame, columns_to_remove: list) -> list:
+        """Returns the DataFrame's columns minus the specified ones (missing names are ignored)."""
+        return [c for c in df.columns if c not in columns_to_remove]
+
+    def write_excel(df: pd.DataFrame, file_path: str) -> None:
+        """Writes df to an .xlsx file using the (faster) xlsxwriter engine.
+        Note: xlsxwriter's constant_memory mode is NOT used - pandas writes cells
+        column by column, which that mode silently drops.
+        """
+        df.to_excel(file_path, engine='xlsxwriter', index=False)
+        return None
+
+    def write_bom(df: pd.DataFrame, base_path: str, as_parquet: bool) -> None:
+        """Writes a BOM table to base_path + '.xlsx', or to '.parquet' (pyarrow, snappy) in Parquet mode."""
+        if as_parquet:
+            df.to_parquet(base_path + ".parquet", engine='pyarrow', compression='snappy', index=False)
+        else:
+            write_excel(df, base_path + ".xlsx")
+        return None
+
+    # Text forms of Number/Level, computed once per run (see run_script) and shared by the helpers below
+    TEXT_CACHE_COLS = ["_num_s", "_lvl_s"]
+
+    def add_text_cache(df: pd.DataFrame, text_dtype: str) -> None:
+        """Adds the cached '_num_s'/'_lvl_s' text columns (NA → '') to df in place."""
+        df["_num_s"] = df["Number"].astype(text_dtype).fillna("")
+        df["_lvl_s"] = df["Level"].astype(text_dtype).fillna("")
         return None
 
     # Robust Level tokenization (used where needed; does not change core flow)
-    def _level_tokens(val) -> list:
+    def _level_keys(levels: pd.Series) -> tuple:
         """
-        Return a robust token list for a Level value.
+        Return integer keys (first token, full token list) for every value of the cached '_lvl_s' column.
         Handles floats like 10.0, strings like '10.1', blanks/NaN, spaces, trailing dots.
+        Two rows get equal keys exactly when their token lists are equal.
         """
-        s = "" if pd.isna(val) else str(val).strip()
-        if s == "" or s.lower() == "nan":
-            return ["0"]
-        s = s.replace(" ", "").strip(".")
-        return s.split(".")
-
-    def remove_welded_components(df, substrings):
-        """Removes rows related to welded assemblies and their sub-components.
-
-        FINAL precise rule:
-        - Keep the welded parent row (tokens P, e.g., ['10','0']).
-        - While in a welded region, drop any subsequent row whose first token equals P[0]
-          AND tokens != P (this catches same-depth children like 10.1, 10.2, ... and deeper ones).
-        - Stop dropping when the first token changes OR when tokens == P (a new 10.0 root).
-        """
-        to_drop = []
+        s = levels.str.strip()
+        blank = (s == "") | (s.str.lower() == "nan")
+        s = s.str.replace(" ", "", regex=False).str.strip(".").mask(blank, "0")
+        token0_ids = pd.factorize(s.str.split(".", n=1).str[0])[0]
+        level_ids = pd.factorize(s)[0]
+        return token0_ids, level_ids
+
+    def substring_pattern(substrings: list):
+        """Compile substrings into one escaped regex alternation; None for an empty list."""
+        if not substrings:
+            return None
+        return re.compile("|".join(map(re.escape, substrings)))
+
+    def _welded_drop_mask(token0_ids: list, level_ids: list, is_welded: list) -> np.ndarray:
+        """State machine behind remove_welded_components, on plain int/bool lists (-1 = no parent)."""
+        to_drop = np.zeros(len(level_ids), dtype=bool)
         welded_active = False
-        parent_tokens = None
-        parent_token0 = None
-
-        for idx, row in df.iterrows():
-            number_str = str(row.get("Number", ""))
-            tokens = _level_tokens(row.get("Level"))
-            token0 = tokens[0]
+        parent_level = -1
+        parent_token0 = -1
 
+        for i, (token0, level, welded) in enumerate(zip(token0_ids, level_ids, is_welded)):
             if welded_active:
                 # New root at same spot (exact same tokens as parent) → end previous region
-                if tokens == parent_tokens:
+                if level == parent_level:
                     welded_active = False
-                    parent_tokens = None
-                    parent_token0 = None
+                    parent_level = -1
+                    parent_token0 = -1
                     # fall through to possibly start a new welded region on this same row
 
                 # Still under same top bucket → drop if not the parent itself
                 elif token0 == parent_token0:
-                    to_drop.append(idx)
+                    to_drop[i] = True
                     continue
                 else:
                     # First token changed → end welded region
                     welded_active = False
-                    parent_tokens = None
-                    parent_token0 = None
+                    parent_level = -1
+                    parent_token0 = -1
                     # fall through to possibly start a new one
 
             # Start welded region if this row is a welded assembly number
-            if any(sub in number_str for sub in substrings):
+            if welded:
                 welded_active = True
-                parent_tokens = tokens
+                parent_level = level
                 parent_token0 = token0
 
-        return df.drop(index=to_drop)
+        return to_drop
 
-    def remove_asm_rows(df, substrings):
-        """Removes rows where the 'Number' column contains specified substrings."""
-        to_drop = []
-        for index, row in df.iterrows():
-            number_str = str(row['Number'])
-            if any(sub in number_str for sub in substrings):
-                to_drop.append(index)
-        new_df = df.drop(index=to_drop)
-        return new_df
+    def remove_welded_components(df, pattern):
+        """Removes rows related to welded assemblies and their sub-components.
 
-    def remove_OEM_sub_components(df: pd.DataFrame) -> None:
+        FINAL precise rule:
+        - Keep the welded parent row (tokens P, e.g., ['10','0']).
+        - While in a welded region, drop any subsequent row whose first token equals P[0]
+          AND tokens != P (this catches same-depth children like 10.1, 10.2, ... and deeper ones).
+        - Stop dropping when the first token changes OR when tokens == P (a new 10.0 root).
+        """
+        if pattern is None:
+            return df
+
+        # Pre-extract Level keys and welded flags column-wise; only the state machine stays per row
+        token0_ids, level_ids = _level_keys(df["_lvl_s"])
+        is_welded = df["_num_s"].str.contains(pattern.pattern, regex=True).to_numpy()
+        return df[~_welded_drop_mask(token0_ids.tolist(), level_ids.tolist(), is_welded.tolist())]
+
+    def remove_asm_rows(df, pattern):
+        """Removes rows where the 'Number' column matches the compiled substring pattern."""
+        if pattern is None:
+            return df
+        mask = df['_num_s'].str.contains(pattern.pattern, regex=True)
+        return df[~mask]
+
+    def remove_OEM_sub_components(df: pd.DataFrame) -> pd.DataFrame:
         """Removes any item with notation AA-A####-# from the BOM."""
-        to_drop = []
-        rows = []
-        nums = []
-        for index, row in df.iterrows():
-            number_str = str(row['Number'])
-            if len(number_str) > 8 and number_str[8] == "-":
-                to_drop.append(index)
-                rows.append(row)
-        new_df = df.drop(index=to_drop)
-        return new_df
-
-    def keep_welded_components(df: pd.DataFrame, substrings) -> pd.DataFrame:
+        number_str = df['_num_s']
+        mask = (number_str.str.len() > 8) & (number_str.str.slice(8, 9) == "-")
+        return df[~mask]
+
+    def keep_welded_components(df: pd.DataFrame, pattern) -> pd.DataFrame:
         """Keeps rows related to welded assemblies and their sub-components."""
-        to_keep = []
+        if pattern is None:
+            return df.iloc[0:0]
+        depths = df['_lvl_s'].str.count(r"\.").to_numpy()
+        welded_mask = df['_num_s'].str.contains(pattern.pattern, regex=True).to_numpy()
+
+        to_keep = np.zeros(len(df), dtype=bool)
         welded_part = False
-        for index, row in df.iterrows():
-            number_str = str(row['Number'])
+        welded_depth = 0
+        for i in range(len(df)):
             if welded_part:
-                level_value = str(row['Level'])
-                depth = len(level_value.split('.')) - 1
-                if depth > welded_depth:
-                    to_keep.append(index)
+                if depths[i] > welded_depth:
+                    to_keep[i] = True
                 else:
                     welded_part = False
-            elif any(sub in number_str for sub in substrings):
-                level_value = str(row['Level'])
+            elif welded_mask[i]:
                 welded_part = True
-                welded_depth = len(level_value.split('.')) - 1
-                to_keep.append(index)
-        df_new = df.loc[to_keep]
-        return df_new
-
-    def keep_rows_with(df: pd.DataFrame, substrings) -> pd.DataFrame:
-        """Keeps only rows where the 'Number' column contains specified substrings."""
-        to_drop = []
-        for index, row in df.iterrows():
-            number_str = str(row['Number'])
-            if not any(sub in number_str for sub in substrings):
-                to_drop.append(index)
-        new_df = df.drop(index=to_drop, inplace=False)
-        return new_df
+                welded_depth = depths[i]
+                to_keep[i] = True
+        return df.iloc[to_keep]
+
+    def keep_rows_with(df: pd.DataFrame, pattern) -> pd.DataFrame:
+        """Keeps only rows where the 'Number' column matches the compiled substring pattern."""
+        if pattern is None:
+            return df.iloc[0:0]
+        mask = df['_num_s'].str.contains(pattern.pattern, regex=True)
+        return df[mask]
 
     # --- Non-invasive Material/Finish helpers (adds fields, no logic change) ---
     def _normalize_col(col: str) -> str:
@@ -152,44 +179,49 @@ def create_gui_and_run_script():
                     return norm_map[ncol]
         return None
 
+    def _vec_safe_str(s: pd.Series) -> pd.Series:
+        """Column-wise text cleanup: strip, and blank out NA / 'nan' / 'none' / 'null'."""
+        out = s.astype("string").fillna("").str.strip()
+        return out.mask(out.str.lower().isin(["nan", "none", "null"]), "")
+
     def coalesce_string_cols(df: pd.DataFrame, target_col: str, source_cols: list) -> pd.Series:
         """Create target_col as first non-empty among source_cols, preserving existing non-empty values."""
-        out = pd.Series("", index=df.index, dtype="object")
+        # Candidates in priority order: existing target values (as-is), then each cleaned source
+        candidates = []
         if target_col in df.columns:
-            out = df[target_col].astype("string").fillna("")
-        def clean(x):
-            s = str(x).strip() if pd.notna(x) else ""
-            return "" if s.lower() in ("nan", "none", "null") else s
+            candidates.append(df[target_col].astype("string").fillna(""))
         for col in source_cols:
             if col and col in df.columns:
-                src = df[col].astype("string").map(clean)
-                out = out.where(out != "", src)
-        return out.fillna("")
+                candidates.append(_vec_safe_str(df[col]))
+        if not candidates:
+            return pd.Series("", index=df.index, dtype="object")
+        # One row-wise first-non-empty reduction instead of one .where pass per candidate
+        # (all-empty rows pick column 0, which is "" as well)
+        stacked = np.column_stack([c.to_numpy(dtype=object) for c in candidates])
+        first = (stacked != "").argmax(axis=1)
+        return pd.Series(stacked[np.arange(len(stacked)), first], index=df.index, dtype="string")
 
     def combine_repeats(df: pd.DataFrame) -> pd.DataFrame:
         """Combines rows with duplicate parts and sums their quantities.
         Grouping logic is unchanged. After grouping, append Material/Finish
-        via a first-nonempty lookup by Number (non-invasive).
+        via a single first-nonempty lookup by Number (non-invasive).
         """
         combined_df = df.groupby(['Number', 'Revision', 'Description', 'State'])['Qty'].sum().reset_index()
         combined_df = combined_df[['Number', 'Revision', 'Description', 'Qty', 'State']]
 
-        def first_nonempty(df_src: pd.DataFrame, col: str):
-            if col not in df_src.columns:
-                return pd.DataFrame(columns=['Number', col])
-            tmp = df_src[['Number', col]].astype({col: 'string'})
-            tmp[col] = tmp[col].fillna('').str.strip()
-            tmp = tmp[tmp[col] != '']
-            return tmp.drop_duplicates(subset=['Number'])
-
-        if 'Material' in df.columns:
-            combined_df = combined_df.merge(first_nonempty(df, 'Material'), on='Number', how='left')
-        else:
-            combined_df['Material'] = ""
-        if 'Finish' in df.columns:
-            combined_df = combined_df.merge(first_nonempty(df, 'Finish'), on='Number', how='left')
-        else:
-            combined_df['Finish'] = ""
+        # First non-empty Material/Finish per Number (one groupby), attached by a hash lookup on Number
+        lookup_cols = [c for c in ('Material', 'Finish') if c in df.columns]
+        if lookup_cols:
+            lookup = df[['Number']].copy()
+            for col in lookup_cols:
+                vals = df[col].astype('string').fillna('').str.strip()
+                lookup[col] = vals.mask(vals == '')
+            lookup = lookup.groupby('Number', sort=False)[lookup_cols].first()
+        for col in ('Material', 'Finish'):
+            if col in lookup_cols:
+                combined_df[col] = combined_df['Number'].map(lookup[col]).fillna('').astype('string')
+            else:
+                combined_df[col] = ""
 
         cols = ['Number', 'Revision', 'Description', 'Qty', 'State', 'Material', 'Finish']
         combined_df = combined_df[cols]
@@ -226,6 +258,7 @@ def create_gui_and_run_script():
         # Get values from GUI widgets
         check_for_pn_str = check_for_pn_var.get()
         check_for_PN = check_for_pn_str == "True"
+        output_parquet = output_parquet_var.get()
         
         # Get the lists and encoding from the GUI, splitting by newline for lists
         columns_to_remove = columns_entry.get("1.0", tk.END).strip().split('\n')
@@ -249,6 +282,10 @@ def create_gui_and_run_script():
             welded_asm_names = []
         if asm_names == ['']:
             asm_names = []
+
+        # Compile each name list once; helpers receive the pattern (None when the list is empty)
+        welded_pat = substring_pattern(welded_asm_names)
+        asm_pat = substring_pattern(asm_names)
             
         try:
             # Create the new "BOMs" directory
@@ -256,8 +293,20 @@ def create_gui_and_run_script():
             output_dir = os.path.join(os.path.dirname(csv_filepath), new_dir_path)
             os.makedirs(output_dir, exist_ok=True)
             
-            # Read the CSV file
-            df = pd.read_csv(csv_filepath, encoding=encoding)
+            # Read the CSV file with the default C parser into Arrow-backed columns (plain NumPy dtypes if
+            # pyarrow is missing). The pyarrow *engine* is not used: it infers timestamps from date-like
+            # text, which changes EBOM/WBOM cells and makes to_excel fail on tz-aware values.
+            try:
+                df = pd.read_csv(csv_filepath, encoding=encoding, dtype_backend='pyarrow')
+                text_dtype = "string[pyarrow]"
+                # Integer columns with blanks arrive as nullable int64[pyarrow]; the NumPy path reads them
+                # as float64 ("1.0"), and Level depth / Description text depend on that → keep it
+                for col in df.columns:
+                    if pd.api.types.is_integer_dtype(df[col].dtype) and df[col].isna().any():
+                        df[col] = df[col].astype("double[pyarrow]")
+            except ImportError:
+                df = pd.read_csv(csv_filepath, encoding=encoding)
+                text_dtype = "string"
 
             # --- Non-invasive: populate Material / Finish from PDM fields ---
             material_candidates = [
@@ -285,90 +334,97 @@ def create_gui_and_run_script():
             df["Finish"]   = coalesce_string_cols(df, "Finish",   fin_sources)
 
             # --- Main script logic from original code ---
+            # File Name without its extension (same rule as os.path.splitext); missing File Names stay NA
+            file_pn = df["File Name"].map(remove_extension, na_action="ignore").astype("string").str.strip()
             if check_for_PN:
-                isWrong = False
                 print("The following files do not have matching File Names and PartNo in Solidworks custom properties. Files to be fixed:")
-                error_log = []
-                for index, row in df.iterrows():
-                    PN = remove_extension(row["File Name"]).strip()
-                    if PN != str(row["Number"]):
-                        isWrong = True
-                        error_log.append(row.to_string())
+                # A missing File Name never matches, not even an empty Number
+                mismatch = (file_pn != df["Number"].astype("string").fillna("")).fillna(True)
+                error_log = df.loc[mismatch].to_string(index=False).splitlines() if mismatch.any() else []
                 if error_log:
                     messagebox.showerror("Validation Error", "File name and 'PartNo' custom properties MUST match for code to work. Please fix the files listed below. Then re-extract the BOM and re-run the code.\n\n" + "\n".join(error_log))
                     return
                 else:
                     print("\tNone. All File Names match PartNo in custom properties.")
             else:
-                for index, row in df.iterrows():
-                    df.loc[index, "Number"] = remove_extension(row["File Name"]).strip()
+                # File Name is the part number here, so a blank one cannot be processed
+                missing_fn = file_pn.isna()
+                if missing_fn.any():
+                    messagebox.showerror("Validation Error", "File Name is blank for some rows, so their part number cannot be taken from the file name. Please fix the files listed below. Then re-extract the BOM and re-run the code.\n\n" + df.loc[missing_fn].to_string(index=False))
+                    return
+                df["Number"] = file_pn
+
+            add_text_cache(df, text_dtype)
+            output_cols = kept_columns(df, columns_to_remove + TEXT_CACHE_COLS)
 
             # Create EBOM file (Material/Finish now present)
             EBOM_filepath = os.path.join(output_dir, remove_extension(os.path.basename(csv_filepath)) + "_EBOM")
-            EBOM = df.copy()  # Make a copy to avoid modifying the original df for subsequent steps
-            remove_column(EBOM, columns_to_remove)
-            EBOM.to_excel(EBOM_filepath + ".xlsx", index=False)
+            EBOM = df[output_cols]  # Column selection only; EBOM goes straight to Excel
+            write_bom(EBOM, EBOM_filepath, output_parquet)
 
             # Create WBOM file
             WBOM_filepath = os.path.join(output_dir, remove_extension(os.path.basename(csv_filepath)) + "_WBOM")
-            WBOM = keep_welded_components(df.copy(), welded_asm_names)
-            remove_column(WBOM, columns_to_remove)
-            first = True
-            current_level_number = [['0'], 0]
-            for index, row in WBOM.iterrows():
-                level_value = str(row['Level'])
-                depth_values = level_value.split('.')
-                if first:
-                    current_level_number = [depth_values, len(depth_values) - 1]
-                    WBOM.loc[index, "Level"] = 0
-                    first = False
-                elif depth_values[0:current_level_number[1] + 1] == current_level_number[0]:
-                    WBOM.loc[index, "Level"] = len(depth_values) - (current_level_number[1] + 1)
+            WBOM = keep_welded_components(df, welded_pat)
+            WBOM = WBOM[output_cols].copy()  # Copy only the (small) welded subset that gets renumbered
+            # Read Level from the output columns so removing it via "Columns to Remove" still errors out
+            level_splits = WBOM['Level'].astype("string").fillna("").str.split('.').tolist()
+            new_levels = np.empty(len(level_splits), dtype=np.int64)
+            current_level_number = None
+            current_depth = 0
+            for i, depth_values in enumerate(level_splits):
+                if current_level_number is not None and depth_values[0:current_depth + 1] == current_level_number:
+                    new_levels[i] = len(depth_values) - (current_depth + 1)
                 else:
-                    current_level_number = [depth_values, len(depth_values) - 1]
-                    WBOM.loc[index, "Level"] = 0
-            
-            WBOM.to_excel(WBOM_filepath + ".xlsx", index=False)
+                    current_level_number = depth_values
+                    current_depth = len(depth_values) - 1
+                    new_levels[i] = 0
+            WBOM["Level"] = new_levels  # already int, safe for the WBOM.txt indentation
 
-            # Ensure Level is int before writing WBOM.txt (prevents float error)
-            WBOM["Level"] = pd.to_numeric(WBOM["Level"], errors="coerce").fillna(0).astype(int)
+            write_bom(WBOM, WBOM_filepath, output_parquet)
 
             # Write WBOM.txt (append Material & Finish non-invasively)
-            def _safe_str(x):
-                s = "" if pd.isna(x) else str(x).strip()
-                return "" if s.lower() in ("nan", "none", "null") else s
+            wbom_lines = []
+            if not WBOM.empty:  # no lines → no columns needed (matters when e.g. Description was removed)
+                lvls = WBOM["Level"].tolist()
+                # Missing Number/Description print as 'nan' whether the column is NumPy- or Arrow-backed (pd.NA)
+                nums = WBOM["Number"].astype("string").fillna("nan").str.strip().to_numpy()
+                descs = WBOM["Description"].astype("string").fillna("nan").to_numpy()
+                # Material/Finish may have been dropped via "Columns to Remove" → write them blank
+                mat_fin = WBOM.reindex(columns=["Material", "Finish"], fill_value="")
+                mats = _vec_safe_str(mat_fin["Material"]).to_numpy()
+                fins = _vec_safe_str(mat_fin["Finish"]).to_numpy()
+                wbom_lines = [
+                    "    " * lvl + num + "    " + desc + "    " + mat + "    " + fin + "\n"
+                    for lvl, num, desc, mat, fin in zip(lvls, nums, descs, mats, fins)
+                ]
 
             with open(WBOM_filepath + ".txt", mode='w', encoding='utf-8') as f:
-                for index, row in WBOM.iterrows():
-                    indentation = "    " * row["Level"]
-                    mat = _safe_str(row.get("Material", ""))
-                    fin = _safe_str(row.get("Finish", ""))
-                    f.write(indentation + str(row["Number"]).strip() + "    " +
-                            str(row["Description"]) + "    " + mat + "    " + fin + "\n")
+                # Build the whole file in memory and hand it to the stream in one write
+                f.write("".join(wbom_lines))
 
             # Create assembly tree file (append Material & Finish non-invasively)
             ASMtree_filepath = os.path.join(output_dir, remove_extension(os.path.basename(csv_filepath)) + "_ASMtree")
-            ASMtree = keep_rows_with(df.copy(), asm_names)
-            ASMtree_list = []
-            for index, row in ASMtree.iterrows():
-                level_value = str(row['Level'])
-                depth = len(level_value.split('.')) - 1
-                mat = _safe_str(row.get("Material", ""))
-                fin = _safe_str(row.get("Finish", ""))
-                ASMtree_list.append((str(row["Number"]) + "    " + str(row["Description"]) + "    " + mat + "    " + fin, depth))
-            
+            ASMtree = keep_rows_with(df, asm_pat)
+            depths = ASMtree['_lvl_s'].str.count(r"\.").tolist()
+            nums = ASMtree['Number'].astype("string").fillna("nan").to_numpy()
+            descs = ASMtree['Description'].astype("string").fillna("nan").to_numpy()
+            blank = pd.Series("", index=ASMtree.index)
+            mats = _vec_safe_str(ASMtree.get("Material", blank)).to_numpy()
+            fins = _vec_safe_str(ASMtree.get("Finish", blank)).to_numpy()
+
             with open(ASMtree_filepath + ".txt", mode='w', encoding='utf-8') as f:
-                for item in ASMtree_list:
-                    indentation = "    " * item[1]
-                    f.write(indentation + item[0].strip() + "\n")
+                f.write("".join([
+                    "    " * depth + (num + "    " + desc + "    " + mat + "    " + fin).strip() + "\n"
+                    for depth, num, desc, mat, fin in zip(depths, nums, descs, mats, fins)
+                ]))
 
             # Create MBOM file (grouping unchanged; remove welded children; then append Material/Finish)
             MBOM_filepath = os.path.join(output_dir, remove_extension(os.path.basename(csv_filepath)) + "_MBOM")
-            MBOM = remove_OEM_sub_components(df.copy())
-            MBOM = remove_welded_components(MBOM, welded_asm_names)  # now drops same-depth children like 10.1, 10.2, ...
-            MBOM = remove_asm_rows(MBOM, asm_names)
+            MBOM = remove_OEM_sub_components(df)  # helpers filter into new frames; df itself is never modified
+            MBOM = remove_welded_components(MBOM, welded_pat)  # now drops same-depth children like 10.1, 10.2, ...
+            MBOM = remove_asm_rows(MBOM, asm_pat)
             MBOM = combine_repeats(MBOM)
-            MBOM.to_excel(MBOM_filepath + ".xlsx", index=False)
+            write_bom(MBOM, MBOM_filepath, output_parquet)
 
             messagebox.showinfo("Success", "BOM processing complete!\n\nFiles saved in the 'BOMs' directory.")
 
@@ -378,7 +434,7 @@ def create_gui_and_run_script():
     # --- GUI Setup ---
     root = tk.Tk()
     root.title("BOM Processor")
-    root.geometry("450x650")
+    root.geometry("450x690")
     root.resizable(False, False)
 
     # Main frame for padding
@@ -441,6 +497,12 @@ def create_gui_and_run_script():
     
     custom_encoding_entry = tk.Entry(main_frame, width=20, state="disabled")
     custom_encoding_entry.pack(anchor="w", pady=(0, 10))
+
+    # Output format (Parquet is much faster to write/reload for large BOMs; Excel stays the default)
+    output_parquet_var = tk.BooleanVar(value=False)
+    output_parquet_check = tk.Checkbutton(main_frame, text="Save EBOM/WBOM/MBOM as Parquet instead of Excel",
+                                          variable=output_parquet_var)
+    output_parquet_check.pack(anchor="w", pady=(0, 5))
     
     # Run button
     run_button = tk.Button(main_frame, text="Run Script", command=run_script)